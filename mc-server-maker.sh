@@ -29,8 +29,12 @@ INTERACTIVE=0
 TMP_DIR=""
 INSTALL_DETAIL=""
 JAVA_COMMAND="${JAVA_BIN:-java}"
-VANILLA_MANIFEST_JSON=""
-FORGE_PROMOTIONS_JSON=""
+VANILLA_MANIFEST_FILE=""
+MANIFEST_PREFETCH_FILE=""
+MANIFEST_PREFETCH_JOB=""
+JSON_CACHE_PATH=""
+TIMESTAMP_NOW=""
+TIMESTAMP_COMPACT=""
 MANAGED_SERVER_DIR=""
 MANAGED_PLATFORM=""
 MANAGED_VERSION=""
@@ -38,6 +42,9 @@ MANAGED_STATE_DIR=""
 MANAGED_PID_FILE=""
 MANAGED_INPUT_FIFO=""
 MANAGED_CONSOLE_LOG=""
+MANAGED_CACHED_PID=""
+EXTERNAL_SERVER_PID=""
+ADDON_CONFIG_CACHE_KEY=""
 LANGUAGE="en"
 CONFIG_DIRECTORY="${XDG_CONFIG_HOME:-${HOME:-.}/.config}/mcsmaker"
 CONFIG_FILE="${MCSMAKER_CONFIG:-$CONFIG_DIRECTORY/config}"
@@ -60,13 +67,16 @@ fi
 
 declare -A TEXT_EN=()
 declare -A TEXT_DE=()
+MESSAGES_DE_LOADED=0
 
 load_messages() {
-  local key english german
+  local with_german="${1:-0}" key english german
   while IFS=$'\t' read -r key english german; do
     [[ -n "$key" ]] || continue
     TEXT_EN["$key"]="$english"
-    TEXT_DE["$key"]="$german"
+    if ((with_german)); then
+      TEXT_DE["$key"]="$german"
+    fi
   done <<'EOF'
 error_label	ERROR	FEHLER
 config_created	Configuration created: %s	Konfiguration erstellt: %s
@@ -112,6 +122,7 @@ unknown_checksum	Unknown checksum type: %s	Unbekannter Prüfsummen-Typ: %s
 checksum_tool_missing	%s is missing. Checksum verification is skipped.	%s fehlt. Prüfsummenprüfung wird übersprungen.
 checksum_mismatch	Checksum mismatch. The download was aborted.	Prüfsumme stimmt nicht. Download wurde abgebrochen.
 checksum_ok	Checksum verified.	Prüfsumme stimmt.
+server_jar_current	server.jar already matches this release. Skipping the download.	server.jar entspricht bereits diesem Release. Download wird übersprungen.
 latest_not_found	Could not find the latest version for %s.	Konnte die neueste Version für %s nicht finden.
 latest_search	Looking up the latest available version for %s ...	Suche die neueste verfügbare Version für %s ...
 invalid_mc_version	Invalid Minecraft version: %s	Ungültige Minecraft-Version: %s
@@ -134,6 +145,7 @@ no_write_access	No write permission for: %s	Keine Schreibrechte für: %s
 server_dir_ready	Server directory: %s	Server-Ordner: %s
 file_backed_up	Existing file backed up: %s	Vorhandene Datei gesichert: %s
 vanilla_download	Fetching Vanilla download from Mojang ...	Hole Vanilla-Download von Mojang ...
+manifest_failed	Could not fetch the Mojang version manifest.	Die Mojang-Versionsliste konnte nicht geladen werden.
 vanilla_not_found	Vanilla version %s was not found.	Vanilla-Version %s wurde nicht gefunden.
 vanilla_no_jar	There is no Vanilla server JAR for %s.	Für %s gibt es keine Vanilla-Server-JAR.
 paper_download	Fetching the newest Paper build ...	Hole neuesten Paper-Build ...
@@ -233,6 +245,7 @@ no_download_version	No compatible download version found.	Keine passende Downloa
 version_no_file	The version contains no file.	Version enthält keine Datei.
 download_not_jar	The download is not a JAR file.	Download ist keine JAR-Datei.
 addon_installed	%s %s installed: %s	%s %s installiert: %s
+addon_up_to_date	%s %s is already installed: %s	%s %s ist bereits installiert: %s
 dependencies_warning	This add-on reports %s required dependency/dependencies. Check the project's Modrinth page.	Dieses Addon meldet %s benötigte Abhängigkeit(en). Prüfe die Modrinth-Seite des Projekts.
 restart_for_addon	The server is still running. Restart it to load the add-on.	Server läuft noch. Starte ihn neu, damit das Addon geladen wird.
 installed_addons	Installed %s:	Installierte %s:
@@ -290,6 +303,15 @@ addon_query_required	Without a terminal, a query is required: addon DIRECTORY QU
 unknown_command	Unknown command: %s. Use --help.	Unbekannter Befehl: %s. Nutze --help.
 management_terminal_required	The management menu requires a terminal.	Das Management-Menü braucht ein Terminal.
 EOF
+  if ((with_german)); then
+    MESSAGES_DE_LOADED=1
+  fi
+}
+
+# msg falls back to English for missing keys, so the German table can be
+# filled lazily. Must run in the parent shell before LANGUAGE flips to de.
+ensure_german_messages() {
+  ((MESSAGES_DE_LOADED)) || load_messages 1
 }
 
 msg() {
@@ -309,6 +331,15 @@ success_msg()  { local key="$1"; shift; success "$(msg "$key" "$@")"; }
 warn_msg()     { local key="$1"; shift; warn "$(msg "$key" "$@")"; }
 die_msg()      { local key="$1"; shift; die "$(msg "$key" "$@")"; }
 
+# Print a localized prompt and read the reply into the named variable in
+# one place instead of repeating msg/read pairs at every prompt site.
+prompt_read() {
+  local __prompt_variable="$1" key="$2"
+  shift 2
+  msg "$key" "$@"
+  read -r "$__prompt_variable"
+}
+
 info()    { printf '%s[i]%s %s\n' "$C_BLUE" "$C_RESET" "$*" >&2; }
 success() { printf '%s[+]%s %s\n' "$C_GREEN" "$C_RESET" "$*" >&2; }
 warn()    { printf '%s[!]%s %s\n' "$C_YELLOW" "$C_RESET" "$*" >&2; }
@@ -320,6 +351,9 @@ cleanup() {
   if [[ -n "$TMP_DIR" && -d "$TMP_DIR" ]]; then
     rm -rf -- "$TMP_DIR"
   fi
+  if [[ -n "$MANIFEST_PREFETCH_FILE" ]]; then
+    rm -f -- "$MANIFEST_PREFETCH_FILE"
+  fi
 }
 
 trap cleanup EXIT
@@ -353,8 +387,15 @@ initialize_config() {
   local configured="" choice="" created=0
 
   if [[ -f "$CONFIG_FILE" ]]; then
-    configured=$(sed -n 's/^[[:space:]]*language[[:space:]]*=[[:space:]]*\(en\|de\)[[:space:]]*$/\1/p' \
-      "$CONFIG_FILE" | head -n1)
+    # Scan for the one language= line in bash; the config is a handful
+    # of lines, so forking sed+head on every start was pure overhead.
+    local line
+    while IFS= read -r line; do
+      if [[ "$line" =~ ^[[:space:]]*language[[:space:]]*=[[:space:]]*(en|de)[[:space:]]*$ ]]; then
+        configured="${BASH_REMATCH[1]}"
+        break
+      fi
+    done <"$CONFIG_FILE"
   else
     created=1
   fi
@@ -380,6 +421,10 @@ initialize_config() {
     esac
   fi
 
+  if [[ "$LANGUAGE" == "de" ]]; then
+    ensure_german_messages
+  fi
+
   if ((created)) || [[ -z "$configured" ]]; then
     if save_language_config; then
       success_msg config_created "$CONFIG_FILE"
@@ -392,21 +437,25 @@ initialize_config() {
 }
 
 check_first_start_apt_packages() {
-  local missing=() answer package
+  local missing=() answer package line
+  local -A installed=()
   command -v apt-get >/dev/null 2>&1 || return 0
 
   info_msg first_start_dependencies
+  # One dpkg-query for all packages instead of a fork per package; it
+  # exits non-zero when any package is unknown, so don't let that kill us.
+  while IFS= read -r line; do
+    [[ "$line" == *' install ok installed' ]] || continue
+    installed["${line%% *}"]=1
+  done < <(dpkg-query -W -f='${Package} ${Status}\n' curl jq default-jdk 2>/dev/null || true)
   for package in curl jq default-jdk; do
-    if ! dpkg-query -W -f='${Status}' "$package" 2>/dev/null | grep -q 'install ok installed'; then
-      missing+=("$package")
-    fi
+    [[ -n "${installed[$package]:-}" ]] || missing+=("$package")
   done
   ((${#missing[@]})) || return 0
 
   warn_msg missing_apt_packages "${missing[*]}"
   if [[ -t 0 ]]; then
-    msg install_apt_packages
-    read -r answer
+    prompt_read answer install_apt_packages
     case "${answer,,}" in
       j|ja|y|yes)
         info_msg apt_installing
@@ -430,8 +479,7 @@ change_language() {
     printf '\n%s\n' "$(msg choose_language)"
     printf '  1) %s\n' "$(msg english_default)"
     printf '  2) %s\n' "$(msg german)"
-    msg choice
-    read -r choice
+    prompt_read choice choice
     case "$choice" in
       1|en|EN|english|English) requested="en" ;;
       2|de|DE|deutsch|Deutsch|german|German) requested="de" ;;
@@ -439,24 +487,36 @@ change_language() {
     esac
   fi
 
+  local previous="$LANGUAGE"
   case "${requested,,}" in
     en|english) LANGUAGE="en" ;;
-    de|deutsch|german) LANGUAGE="de" ;;
+    de|deutsch|german) LANGUAGE="de"; ensure_german_messages ;;
     *) die_msg invalid_language ;;
   esac
+  # Nothing changed and the file exists: skip the rewrite-and-rename.
+  if [[ "$LANGUAGE" == "$previous" && -f "$CONFIG_FILE" ]]; then
+    success_msg language_saved
+    return 0
+  fi
   save_language_config || return 1
   success_msg language_saved
 }
 
+MAIN_BANNER=""
+
 show_banner() {
-  printf '%s' "$C_BLUE"
-  printf '%s\n' '  __  __  ____ ____  __  __       _             '
-  printf '%s\n' ' |  \/  |/ ___/ ___||  \/  | __ _| | _____ _ __ '
-  printf '%s\n' ' | |\/| | |   \___ \| |\/| |/ _` | |/ / _ \ `__|'
-  printf '%s\n' ' | |  | | |___ ___) | |  | | (_| |   <  __/ |   '
-  printf '%s\n' ' |_|  |_|\____|____/|_|  |_|\__,_|_|\_\___|_|   '
-  printf '%s\n' "$C_RESET"
-  printf '%sLinux Minecraft Server Maker v%s%s\n\n' "$C_DIM" "$SCRIPT_VERSION" "$C_RESET"
+  # The banner never changes at runtime; render it once and replay the
+  # cached string with a single write on later menu iterations.
+  if [[ -z "$MAIN_BANNER" ]]; then
+    local art='  __  __  ____ ____  __  __       _
+ |  \/  |/ ___/ ___||  \/  | __ _| | _____ _ __
+ | |\/| | |   \___ \| |\/| |/ _` | |/ / _ \ `__|
+ | |  | | |___ ___) | |  | | (_| |   <  __/ |
+ |_|  |_|\____|____/|_|  |_|\__,_|_|\_\___|_|   '
+    printf -v MAIN_BANNER '%s%s\n%s\n%sLinux Minecraft Server Maker v%s%s\n\n' \
+      "$C_BLUE" "$art" "$C_RESET" "$C_DIM" "$SCRIPT_VERSION" "$C_RESET"
+  fi
+  printf '%s' "$MAIN_BANNER"
 }
 
 usage() {
@@ -613,21 +673,18 @@ choose_interactively() {
     *) die_msg invalid_choice ;;
   esac
 
-  msg mc_version_prompt
-  read -r input
+  prompt_read input mc_version_prompt
   REQUESTED_VERSION="${input:-latest}"
+  prefetch_vanilla_manifest
 
-  msg min_ram_prompt
-  read -r input
+  prompt_read input min_ram_prompt
   MIN_RAM="${input:-1G}"
 
-  msg max_ram_prompt
-  read -r input
+  prompt_read input max_ram_prompt
   MAX_RAM="${input:-4G}"
 
   printf '\nMinecraft-EULA: https://aka.ms/MinecraftEULA\n'
-  msg eula_accept_prompt
-  read -r input
+  prompt_read input eula_accept_prompt
   case "$input" in
     j|J|ja|JA|Ja|y|Y|yes|YES|Yes) ACCEPT_EULA=1 ;;
     *) ACCEPT_EULA=0 ;;
@@ -693,45 +750,153 @@ check_dependencies() {
     dependency_hint
     exit 1
   fi
+  setup_curl_session_cache
+}
+
+# Separate curl processes cannot share sockets, but they can share an
+# Alt-Svc cache: once a host has advertised HTTP/2/3 support, follow-up
+# requests skip the protocol negotiation round trip. Probed once per
+# run since old curl builds lack --alt-svc.
+CURL_SESSION_CACHE_READY=0
+
+setup_curl_session_cache() {
+  ((CURL_SESSION_CACHE_READY == 0)) || return 0
+  CURL_SESSION_CACHE_READY=1
+  mkdir -p "$JSON_CACHE_DIRECTORY" 2>/dev/null || return 0
+  if curl --alt-svc "$JSON_CACHE_DIRECTORY/alt-svc.txt" --version >/dev/null 2>&1; then
+    CURL_BASE_ARGS+=(--alt-svc "$JSON_CACHE_DIRECTORY/alt-svc.txt")
+  fi
 }
 
+# One shared option set for every curl invocation so retry and TLS
+# policy stay consistent across the HTTP helpers.
+CURL_BASE_ARGS=(
+  --fail --location --silent --show-error
+  --retry 3 --retry-delay 2 --connect-timeout 20
+  --proto '=https'
+)
+
 http_get() {
   local url="$1"
-  curl --fail --location --silent --show-error \
-    --retry 3 --retry-delay 2 --connect-timeout 20 \
-    --proto '=https' "$url"
+  curl "${CURL_BASE_ARGS[@]}" "$url"
+}
+
+# Fetch several same-host URLs with one curl process, reusing its
+# connection pool instead of paying a TLS handshake per request.
+# Usage: http_get_multi OUTPUT URL [OUTPUT URL ...]
+http_get_multi() {
+  local args=("${CURL_BASE_ARGS[@]}" --parallel)
+  while (($# >= 2)); do
+    args+=(--output "$1" "$2")
+    shift 2
+  done
+  curl "${args[@]}"
 }
 
 paper_get() {
   local url="$1"
-  curl --fail --location --silent --show-error \
-    --retry 3 --retry-delay 2 --connect-timeout 20 \
-    --proto '=https' -H "User-Agent: $PAPER_USER_AGENT" "$url"
+  curl "${CURL_BASE_ARGS[@]}" -H "User-Agent: $PAPER_USER_AGENT" "$url"
 }
 
 modrinth_get() {
   local url="$1"
-  curl --fail --location --silent --show-error \
-    --retry 3 --retry-delay 2 --connect-timeout 20 \
-    --proto '=https' -H "User-Agent: $MODRINTH_USER_AGENT" "$url"
+  curl "${CURL_BASE_ARGS[@]}" -H "User-Agent: $MODRINTH_USER_AGENT" "$url"
 }
 
 download_file() {
   local url="$1" output="$2" user_agent="${3:-}"
-  local args=(
-    --fail --location --silent --show-error
-    --retry 3 --retry-delay 2 --connect-timeout 20
-    --proto '=https' --output "$output"
-  )
+  # Large files (server jars, installers) are split across parallel
+  # range requests; anything small or range-less takes the plain path.
+  if ! download_file_segmented "$url" "$output" "$user_agent"; then
+    local args=("${CURL_BASE_ARGS[@]}" --output "$output")
+    if [[ -n "$user_agent" ]]; then
+      args+=(-H "User-Agent: $user_agent")
+    fi
+    curl "${args[@]}" "$url"
+  fi
+  [[ -s "$output" ]] || die_msg download_empty "$url"
+}
+
+# Split large downloads across parallel HTTP range requests. Only kicks
+# in when the server reports a size above the threshold and accepts
+# byte ranges; callers fall back to download_file otherwise.
+DOWNLOAD_SEGMENT_THRESHOLD=$((16 * 1024 * 1024))
+# Concurrent range streams per large download. MCSMAKER_DOWNLOAD_STREAMS
+# overrides the default within 1..16; more streams help on fat pipes,
+# fewer keep slow mirrors from being hammered.
+DOWNLOAD_SEGMENTS=4
+if [[ "${MCSMAKER_DOWNLOAD_STREAMS:-}" =~ ^([1-9]|1[0-6])$ ]]; then
+  DOWNLOAD_SEGMENTS="$MCSMAKER_DOWNLOAD_STREAMS"
+fi
+
+probe_segmented_download() {
+  local url="$1" user_agent="${2:-}" headers line size="" accept_ranges=""
+  local args=("${CURL_BASE_ARGS[@]}" --head)
   if [[ -n "$user_agent" ]]; then
     args+=(-H "User-Agent: $user_agent")
   fi
-  curl "${args[@]}" "$url"
-  [[ -s "$output" ]] || die_msg download_empty "$url"
+  headers=$(curl "${args[@]}" "$url" 2>/dev/null) || return 1
+  while IFS= read -r line; do
+    if [[ "$line" =~ ^[Cc]ontent-[Ll]ength:[[:space:]]*([0-9]+) ]]; then
+      size="${BASH_REMATCH[1]}"
+    elif [[ "$line" =~ ^[Aa]ccept-[Rr]anges:[[:space:]]*([^[:space:]$'\r']+) ]]; then
+      accept_ranges="${BASH_REMATCH[1]}"
+    fi
+  done <<<"$headers"
+  [[ "${accept_ranges,,}" == bytes ]] || return 1
+  [[ "$size" =~ ^[0-9]+$ ]] || return 1
+  ((size >= DOWNLOAD_SEGMENT_THRESHOLD)) || return 1
+  printf '%s\n' "$size"
+}
+
+download_file_segmented() {
+  local url="$1" output="$2" user_agent="${3:-}" size part_size start end part job failed=0 i
+  local jobs=() parts=()
+  size=$(probe_segmented_download "$url" "$user_agent") || return 1
+
+  local args=("${CURL_BASE_ARGS[@]}")
+  if [[ -n "$user_agent" ]]; then
+    args+=(-H "User-Agent: $user_agent")
+  fi
+
+  part_size=$(( (size + DOWNLOAD_SEGMENTS - 1) / DOWNLOAD_SEGMENTS ))
+  for ((i = 0; i < DOWNLOAD_SEGMENTS; i++)); do
+    start=$((i * part_size))
+    ((start < size)) || break
+    end=$((start + part_size - 1))
+    ((end < size)) || end=$((size - 1))
+    part="${output}.part${i}"
+    curl "${args[@]}" --range "${start}-${end}" --output "$part" "$url" &
+    jobs+=("$!")
+    parts+=("$part")
+  done
+
+  for job in "${jobs[@]}"; do
+    wait "$job" || failed=1
+  done
+  if ((failed)); then
+    rm -f -- "${parts[@]}"
+    return 1
+  fi
+
+  cat -- "${parts[@]}" >"$output" || { rm -f -- "${parts[@]}" "$output"; return 1; }
+  rm -f -- "${parts[@]}"
+  [[ "$(wc -c <"$output")" -eq "$size" ]] || { rm -f -- "$output"; return 1; }
 }
 
 urlencode() {
-  jq -nr --arg value "$1" '$value|@uri'
+  # Pure bash percent-encoding; the C locale makes the loop walk bytes,
+  # so multi-byte UTF-8 input encodes the same way jq's @uri did.
+  local LC_ALL=C
+  local value="$1" encoded="" character i
+  for ((i = 0; i < ${#value}; i++)); do
+    character="${value:i:1}"
+    case "$character" in
+      [A-Za-z0-9._~-]) encoded+="$character" ;;
+      *) printf -v character '%%%02X' "'$character"; encoded+="$character" ;;
+    esac
+  done
+  printf '%s\n' "$encoded"
 }
 
 validate_jar() {
@@ -741,6 +906,25 @@ validate_jar() {
   [[ "$magic" == "504b" ]] || die_msg not_jar
 }
 
+# Quiet probe used to skip downloads: succeeds only when the file exists
+# and its checksum provably matches the expected value. Unlike
+# verify_checksum this never dies and never treats "unverifiable" as ok.
+checksum_matches() {
+  local algorithm="$1" expected="$2" file="$3" command actual
+  [[ -n "$expected" && "$expected" != "null" && -f "$file" ]] || return 1
+
+  case "$algorithm" in
+    sha1) command="sha1sum" ;;
+    sha256) command="sha256sum" ;;
+    sha512) command="sha512sum" ;;
+    *) return 1 ;;
+  esac
+
+  command -v "$command" >/dev/null 2>&1 || return 1
+  read -r actual _ < <("$command" "$file" 2>/dev/null) || actual=""
+  [[ -n "$actual" && "${actual,,}" == "${expected,,}" ]]
+}
+
 verify_checksum() {
   local algorithm="$1" expected="$2" file="$3" command actual
   [[ -n "$expected" && "$expected" != "null" ]] || return 0
@@ -757,23 +941,148 @@ verify_checksum() {
     return 0
   fi
 
-  actual=$("$command" "$file" | awk '{print $1}')
-  [[ "${actual,,}" == "${expected,,}" ]] || die_msg checksum_mismatch
+  read -r actual _ < <("$command" "$file") || true
+  [[ -n "$actual" && "${actual,,}" == "${expected,,}" ]] || die_msg checksum_mismatch
   success_msg checksum_ok
 }
 
-get_vanilla_manifest() {
-  if [[ -z "$VANILLA_MANIFEST_JSON" ]]; then
-    VANILLA_MANIFEST_JSON=$(http_get "$MOJANG_MANIFEST")
+# Small on-disk cache for JSON API responses. Immutable documents
+# (per-version metadata never changes for a given URL) are served from
+# disk indefinitely; mutable ones are refreshed once their cached copy
+# is older than JSON_CACHE_TTL seconds. A stale copy still beats a
+# failed fetch, so network errors fall back to whatever is on disk.
+JSON_CACHE_DIRECTORY="$CONFIG_DIRECTORY/cache"
+JSON_CACHE_TTL=600
+
+json_cache_path() {
+  local url="$1"
+  JSON_CACHE_PATH="$JSON_CACHE_DIRECTORY/${url//[^A-Za-z0-9._-]/_}"
+}
+
+# Usage: http_get_json_cached URL [immutable] [jq_filter]
+# An optional jq filter is applied once when the response is stored, so
+# heavily re-read documents can cache just the fields consumers use.
+http_get_json_cached() {
+  local url="$1" immutable="${2:-}" filter="${3:-}" cache tmp mtime now
+  if ! mkdir -p "$JSON_CACHE_DIRECTORY" 2>/dev/null; then
+    http_get "$url"
+    return
+  fi
+  json_cache_path "$url"
+  cache="$JSON_CACHE_PATH"
+
+  if [[ -s "$cache" ]]; then
+    if [[ -n "$immutable" ]]; then
+      cat -- "$cache"
+      return 0
+    fi
+    mtime=$(stat -c %Y "$cache" 2>/dev/null) || mtime=0
+    printf -v now '%(%s)T' -1
+    if ((now - mtime < JSON_CACHE_TTL)); then
+      cat -- "$cache"
+      return 0
+    fi
+  fi
+
+  tmp="${cache}.tmp.$$"
+  if [[ -s "$cache" ]]; then
+    # A stale copy exists to fall back on, so keep the refresh quiet.
+    if [[ -n "$filter" ]]; then
+      http_get "$url" 2>/dev/null | jq -c "$filter" >"$tmp" 2>/dev/null || true
+    else
+      http_get "$url" >"$tmp" 2>/dev/null || true
+    fi
+  else
+    # Cold cache: this attempt is the only shot, so let curl's
+    # --show-error diagnostics through instead of failing silently.
+    if [[ -n "$filter" ]]; then
+      http_get "$url" | jq -c "$filter" >"$tmp" || true
+    else
+      http_get "$url" >"$tmp" || true
+    fi
+  fi
+  if [[ -s "$tmp" ]]; then
+    mv -f -- "$tmp" "$cache"
+  else
+    rm -f -- "$tmp"
+    [[ -s "$cache" ]] || return 1
   fi
-  printf '%s\n' "$VANILLA_MANIFEST_JSON"
+  cat -- "$cache"
 }
 
-get_forge_promotions() {
-  if [[ -z "$FORGE_PROMOTIONS_JSON" ]]; then
-    FORGE_PROMOTIONS_JSON=$(http_get "$FORGE_FILES/promotions_slim.json")
+# Only the latest-release pointer and each version's id/url are ever
+# read from the ~2 MB manifest; caching a slimmed copy means repeat
+# queries scan kilobytes instead.
+MANIFEST_SLIM_FILTER='{latest: {release: .latest.release}, versions: [.versions[] | {id, url}]}'
+
+# Start fetching the Mojang manifest in the background so the download
+# overlaps with the remaining interactive prompts.
+prefetch_vanilla_manifest() {
+  [[ "$PLATFORM" == "vanilla" ]] || return 0
+  [[ -z "$MANIFEST_PREFETCH_JOB" && -z "$VANILLA_MANIFEST_FILE" ]] || return 0
+  command -v curl >/dev/null 2>&1 || return 0
+
+  MANIFEST_PREFETCH_FILE=$(mktemp "${TMPDIR:-/tmp}/mcsmaker-manifest.XXXXXXXX" 2>/dev/null) || {
+    MANIFEST_PREFETCH_FILE=""
+    return 0
+  }
+  http_get_json_cached "$MOJANG_MANIFEST" "" "$MANIFEST_SLIM_FILTER" \
+    >"$MANIFEST_PREFETCH_FILE" 2>/dev/null &
+  MANIFEST_PREFETCH_JOB=$!
+}
+
+collect_prefetched_manifest() {
+  local job="$MANIFEST_PREFETCH_JOB" file="$MANIFEST_PREFETCH_FILE"
+  [[ -n "$job" ]] || return 1
+  MANIFEST_PREFETCH_JOB=""
+  if wait "$job" 2>/dev/null && [[ -s "$file" ]]; then
+    # Keep the temp file; cleanup() removes it via MANIFEST_PREFETCH_FILE.
+    VANILLA_MANIFEST_FILE="$file"
+    return 0
   fi
-  printf '%s\n' "$FORGE_PROMOTIONS_JSON"
+  MANIFEST_PREFETCH_FILE=""
+  rm -f -- "$file"
+  return 1
+}
+
+# Must run in the parent shell (not a command substitution) so the cache
+# variable survives and a prefetch job can be reaped. Consumers point jq
+# at VANILLA_MANIFEST_FILE so the multi-megabyte document streams from
+# disk instead of round-tripping through shell variables and herestrings.
+ensure_vanilla_manifest() {
+  [[ -n "$VANILLA_MANIFEST_FILE" && -s "$VANILLA_MANIFEST_FILE" ]] && return 0
+  collect_prefetched_manifest && return 0
+
+  # Capture the fetch output: when the cache directory cannot be
+  # created, http_get_json_cached streams the live document instead of
+  # storing it, and this capture is then the only copy we get.
+  local fetched
+  fetched=$(mktemp "${TMPDIR:-/tmp}/mcsmaker-manifest.XXXXXXXX" 2>/dev/null) || fetched=""
+  http_get_json_cached "$MOJANG_MANIFEST" "" "$MANIFEST_SLIM_FILTER" >"${fetched:-/dev/null}" || {
+    rm -f -- "$fetched"
+    die_msg manifest_failed
+  }
+  json_cache_path "$MOJANG_MANIFEST"
+  if [[ -s "$JSON_CACHE_PATH" ]]; then
+    VANILLA_MANIFEST_FILE="$JSON_CACHE_PATH"
+    rm -f -- "$fetched"
+  elif [[ -n "$fetched" && -s "$fetched" ]]; then
+    # Keep the captured copy; cleanup() removes it via MANIFEST_PREFETCH_FILE.
+    MANIFEST_PREFETCH_FILE="$fetched"
+    VANILLA_MANIFEST_FILE="$fetched"
+  else
+    rm -f -- "$fetched"
+    die_msg manifest_failed
+  fi
+  return 0
+}
+
+get_forge_promotions() {
+  # Always invoked through command substitution, so a cache variable
+  # assigned here could never survive the subshell; the on-disk JSON
+  # cache is what actually carries the document between calls and runs,
+  # with the OS page cache serving the repeat reads.
+  http_get_json_cached "$FORGE_FILES/promotions_slim.json"
 }
 
 resolve_latest_version() {
@@ -781,8 +1090,8 @@ resolve_latest_version() {
 
   case "$PLATFORM" in
     vanilla)
-      json=$(get_vanilla_manifest)
-      version=$(jq -r '.latest.release // empty' <<<"$json")
+      ensure_vanilla_manifest
+      version=$(jq -r '.latest.release // empty' "$VANILLA_MANIFEST_FILE")
       ;;
     paper)
       json=$(paper_get "$PAPER_API/projects/paper")
@@ -794,8 +1103,17 @@ resolve_latest_version() {
       ;;
     forge)
       json=$(get_forge_promotions)
-      version=$(jq -r '.promos | keys[] | select(endswith("-latest")) | sub("-latest$"; "")' \
-        <<<"$json" | LC_ALL=C sort -V | tail -n1)
+      # Track the maximum while reading instead of sorting the whole
+      # key list; version_ge compares the dotted versions numerically.
+      local candidate
+      version=""
+      while IFS= read -r candidate; do
+        [[ -n "$candidate" ]] || continue
+        if [[ -z "$version" ]] || version_ge "$candidate" "$version"; then
+          version="$candidate"
+        fi
+      done < <(jq -r '.promos | keys[] | select(endswith("-latest")) | sub("-latest$"; "")' \
+        <<<"$json")
       ;;
   esac
 
@@ -816,19 +1134,58 @@ resolve_version() {
 }
 
 version_ge() {
-  local current="$1" minimum="$2" first
+  local current="$1" minimum="$2" first i left right
+  local -a current_parts minimum_parts
+
+  # Fast path for plain dotted-numeric versions (the usual case), which
+  # avoids forking sort -V for every comparison.
+  if [[ "$current" =~ ^[0-9]+(\.[0-9]+)*$ && "$minimum" =~ ^[0-9]+(\.[0-9]+)*$ ]]; then
+    IFS=. read -ra current_parts <<<"$current"
+    IFS=. read -ra minimum_parts <<<"$minimum"
+    for ((i = 0; i < ${#current_parts[@]} || i < ${#minimum_parts[@]}; i++)); do
+      left=${current_parts[i]:-0}
+      right=${minimum_parts[i]:-0}
+      if ((left > right)); then
+        return 0
+      elif ((left < right)); then
+        return 1
+      fi
+    done
+    return 0
+  fi
+
   first=$(printf '%s\n%s\n' "$minimum" "$current" | LC_ALL=C sort -V | head -n1)
   [[ "$first" == "$minimum" ]]
 }
 
 required_java_for() {
-  local version="$1"
-
-  if [[ "$version" =~ ^([0-9]+)\. ]]; then
-    if ((BASH_REMATCH[1] >= 26)); then
+  local version="$1" major minor patch
+
+  # Parse the usual dotted-numeric form once and branch on integers
+  # instead of walking a ladder of version_ge comparisons.
+  if [[ "$version" =~ ^([0-9]+)(\.([0-9]+))?(\.([0-9]+))?$ ]]; then
+    major=${BASH_REMATCH[1]}
+    minor=${BASH_REMATCH[3]:-0}
+    patch=${BASH_REMATCH[5]:-0}
+    if ((major >= 26)); then
       printf '25\n'
-      return
+    elif ((major > 1 || minor > 20 || (minor == 20 && patch >= 5))); then
+      printf '21\n'
+    elif ((minor >= 18)); then
+      printf '17\n'
+    elif ((minor >= 17)); then
+      printf '16\n'
+    else
+      printf '8\n'
     fi
+    return
+  fi
+
+  # Suffixed strings like "26.0-rc1" skip the fast path above but must
+  # still get the >= 26 rule; check the numeric prefix before the ladder.
+  if [[ "$version" =~ ^([0-9]+)\. ]] && ((BASH_REMATCH[1] >= 26)); then
+    printf '25\n'
+    return
   fi
 
   if version_ge "$version" "1.20.5"; then
@@ -845,14 +1202,13 @@ required_java_for() {
 installed_java_major() {
   local output version
   output=$("$JAVA_COMMAND" -version 2>&1 || true)
-  version=$(sed -n 's/.*version "\([0-9][0-9.]*\).*/\1/p' <<<"$output" | head -n1)
-  [[ -n "$version" ]] || return 1
+  [[ "$output" =~ version\ \"([0-9][0-9.]*) ]] || return 1
+  version="${BASH_REMATCH[1]}"
 
   if [[ "$version" == 1.* ]]; then
-    printf '%s\n' "$(cut -d. -f2 <<<"$version")"
-  else
-    printf '%s\n' "${version%%.*}"
+    version="${version#1.}"
   fi
+  printf '%s\n' "${version%%.*}"
 }
 
 check_java() {
@@ -893,7 +1249,12 @@ check_java() {
 }
 
 directory_has_files() {
-  [[ -d "$1" ]] && [[ -n "$(find "$1" -mindepth 1 -maxdepth 1 -print -quit 2>/dev/null)" ]]
+  local entry
+  [[ -d "$1" ]] || return 1
+  for entry in "$1"/* "$1"/.[!.]* "$1"/..?*; do
+    [[ -e "$entry" || -L "$entry" ]] && return 0
+  done
+  return 1
 }
 
 prepare_server_directory() {
@@ -904,8 +1265,7 @@ prepare_server_directory() {
   default_dir="./mc-server-${PLATFORM}-${safe_version}"
 
   if ((INTERACTIVE)); then
-    msg server_dir_prompt "$default_dir"
-    read -r answer
+    prompt_read answer server_dir_prompt "$default_dir"
     SERVER_DIR="${answer:-$default_dir}"
   elif [[ -z "$SERVER_DIR" ]]; then
     SERVER_DIR="$default_dir"
@@ -919,8 +1279,7 @@ prepare_server_directory() {
   if ((was_nonempty && ! ALLOW_NONEMPTY)); then
     if ((INTERACTIVE)); then
       warn_msg directory_not_empty
-      msg continue_anyway
-      read -r answer
+      prompt_read answer continue_anyway
       case "$answer" in
         j|J|ja|JA|Ja|y|Y|yes|YES|Yes) ALLOW_NONEMPTY=1 ;;
         *) die_msg aborted ;;
@@ -935,18 +1294,33 @@ prepare_server_directory() {
   [[ "$SERVER_DIR" != "/" ]] || die_msg root_dir_forbidden
   [[ -w "$SERVER_DIR" ]] || die_msg no_write_access "$SERVER_DIR"
 
-  TMP_DIR=$(mktemp -d "${TMPDIR:-/tmp}/mcsmaker.XXXXXXXX")
+  # Keep the staging directory on the same filesystem as the server, so
+  # moving a downloaded jar into place is a rename instead of copying
+  # tens of megabytes out of a tmpfs /tmp.
+  TMP_DIR=$(mktemp -d "$SERVER_DIR/.mcsmaker-tmp.XXXXXXXX" 2>/dev/null) || \
+    TMP_DIR=$(mktemp -d "${TMPDIR:-/tmp}/mcsmaker.XXXXXXXX")
   success_msg server_dir_ready "$SERVER_DIR"
 }
 
+# Timestamps via the printf builtin instead of a date fork per written
+# file. Sets TIMESTAMP_NOW (ISO 8601) or TIMESTAMP_COMPACT (filenames).
+timestamp_now() {
+  printf -v TIMESTAMP_NOW '%(%Y-%m-%dT%H:%M:%S%z)T' -1
+}
+
+timestamp_compact() {
+  printf -v TIMESTAMP_COMPACT '%(%Y%m%d-%H%M%S)T' -1
+}
+
 backup_file() {
   local source="$1" backup counter=0
   [[ -e "$source" || -L "$source" ]] || return 0
 
-  backup="${source}.backup-$(date +%Y%m%d-%H%M%S)"
+  timestamp_compact
+  backup="${source}.backup-${TIMESTAMP_COMPACT}"
   while [[ -e "$backup" || -L "$backup" ]]; do
     ((counter += 1))
-    backup="${source}.backup-$(date +%Y%m%d-%H%M%S)-${counter}"
+    backup="${source}.backup-${TIMESTAMP_COMPACT}-${counter}"
   done
   mv -- "$source" "$backup"
   warn_msg file_backed_up "$(basename -- "$backup")"
@@ -961,23 +1335,27 @@ install_server_jar() {
 }
 
 install_vanilla() {
-  local manifest metadata_url metadata server_url sha1 downloaded
+  local metadata_url metadata server_url sha1 downloaded
 
   info_msg vanilla_download
-  manifest=$(get_vanilla_manifest)
+  ensure_vanilla_manifest
   metadata_url=$(jq -r --arg version "$MC_VERSION" \
-    'first(.versions[] | select(.id == $version) | .url) // empty' <<<"$manifest")
+    'first(.versions[] | select(.id == $version) | .url) // empty' "$VANILLA_MANIFEST_FILE")
   [[ -n "$metadata_url" ]] || die_msg vanilla_not_found "$MC_VERSION"
 
-  metadata=$(http_get "$metadata_url")
+  metadata=$(http_get_json_cached "$metadata_url" immutable)
   server_url=$(jq -r '.downloads.server.url // empty' <<<"$metadata")
   sha1=$(jq -r '.downloads.server.sha1 // empty' <<<"$metadata")
   [[ -n "$server_url" ]] || die_msg vanilla_no_jar "$MC_VERSION"
 
-  downloaded="$TMP_DIR/vanilla-server.jar"
-  download_file "$server_url" "$downloaded"
-  verify_checksum sha1 "$sha1" "$downloaded"
-  install_server_jar "$downloaded"
+  if checksum_matches sha1 "$sha1" "$SERVER_DIR/server.jar"; then
+    success_msg server_jar_current
+  else
+    downloaded="$TMP_DIR/vanilla-server.jar"
+    download_file "$server_url" "$downloaded"
+    verify_checksum sha1 "$sha1" "$downloaded"
+    install_server_jar "$downloaded"
+  fi
   INSTALL_DETAIL="Vanilla $MC_VERSION"
 }
 
@@ -1006,26 +1384,44 @@ install_paper() {
     warn_msg paper_unstable "$MC_VERSION" "$channel" "$build_id"
   fi
 
-  downloaded="$TMP_DIR/paper-server.jar"
-  download_file "$server_url" "$downloaded" "$PAPER_USER_AGENT"
-  verify_checksum sha256 "$sha256" "$downloaded"
-  install_server_jar "$downloaded"
+  if checksum_matches sha256 "$sha256" "$SERVER_DIR/server.jar"; then
+    success_msg server_jar_current
+  else
+    downloaded="$TMP_DIR/paper-server.jar"
+    download_file "$server_url" "$downloaded" "$PAPER_USER_AGENT"
+    verify_checksum sha256 "$sha256" "$downloaded"
+    install_server_jar "$downloaded"
+  fi
   mkdir -p -- "$SERVER_DIR/plugins"
   INSTALL_DETAIL="Paper $MC_VERSION, Build $build_id ($channel)"
 }
 
 install_fabric() {
   local encoded loader_json installer_json loader installer server_url downloaded
+  local loader_file="$TMP_DIR/fabric-loader.json" installer_file="$TMP_DIR/fabric-installer.json"
 
   info_msg fabric_search
   encoded=$(urlencode "$MC_VERSION")
-  loader_json=$(http_get "$FABRIC_META/versions/loader/${encoded}") || \
-    die_msg fabric_unsupported "$MC_VERSION"
+  # The loader and installer lookups are independent and hit the same
+  # host; one curl process fetches both concurrently over a shared
+  # connection, avoiding a second TLS handshake.
+  if ! http_get_multi \
+    "$loader_file" "$FABRIC_META/versions/loader/${encoded}" \
+    "$installer_file" "$FABRIC_META/versions/installer" 2>/dev/null; then
+    # Either the loader lookup legitimately failed or this curl lacks
+    # --parallel; retry sequentially to tell the two apart.
+    http_get "$FABRIC_META/versions/loader/${encoded}" >"$loader_file" || \
+      die_msg fabric_unsupported "$MC_VERSION"
+    http_get "$FABRIC_META/versions/installer" >"$installer_file" || \
+      die_msg fabric_no_installer
+  fi
+
+  loader_json=$(<"$loader_file")
   loader=$(jq -r 'first(.[] | select(.loader.stable == true) | .loader.version) // .[0].loader.version // empty' \
     <<<"$loader_json")
   [[ -n "$loader" ]] || die_msg fabric_no_loader "$MC_VERSION"
 
-  installer_json=$(http_get "$FABRIC_META/versions/installer")
+  installer_json=$(<"$installer_file")
   installer=$(jq -r 'first(.[] | select(.stable == true) | .version) // .[0].version // empty' \
     <<<"$installer_json")
   [[ -n "$installer" ]] || die_msg fabric_no_installer
@@ -1039,20 +1435,28 @@ install_fabric() {
 }
 
 forge_coordinate() {
-  local mc_version="$1" forge_version="$2" metadata prefix coordinate candidate
+  local mc_version="$1" forge_version="$2" metadata prefix coordinate candidate line
+  local candidates=()
   prefix="${mc_version}-${forge_version}"
   coordinate=""
 
+  # The metadata lists every Forge version ever released; scan it once
+  # in bash and version-sort only the handful matching our prefix,
+  # instead of piping the whole document through tr, sed and sort.
   if metadata=$(http_get "$FORGE_MAVEN/maven-metadata.xml" 2>/dev/null); then
-    while IFS= read -r candidate; do
+    while IFS= read -r line; do
+      [[ "$line" == *'<version>'* ]] || continue
+      line="${line#*<version>}"
+      candidate="${line%%<*}"
       if [[ "$candidate" == "$prefix" || "$candidate" == "$prefix"-* ]]; then
-        coordinate="$candidate"
+        candidates+=("$candidate")
       fi
-    done < <(
-      tr '<' '\n' <<<"$metadata" |
-        sed -n 's#^version>\([^<]*\).*#\1#p' |
-        LC_ALL=C sort -V
-    )
+    done <<<"$metadata"
+    if ((${#candidates[@]} == 1)); then
+      coordinate="${candidates[0]}"
+    elif ((${#candidates[@]} > 1)); then
+      coordinate=$(printf '%s\n' "${candidates[@]}" | LC_ALL=C sort -V | tail -n1)
+    fi
   fi
 
   printf '%s\n' "${coordinate:-$prefix}"
@@ -1080,10 +1484,22 @@ configure_forge_jvm_args() {
 }
 
 find_legacy_forge_jar() {
-  find "$SERVER_DIR" -maxdepth 1 -type f -name 'forge-*.jar' \
-    ! -name '*installer*.jar' ! -name '*sources*.jar' -print 2>/dev/null |
-    sed 's#^.*/##' |
-    LC_ALL=C sort -V | tail -n1
+  local jar name
+  local jars=()
+  for jar in "$SERVER_DIR"/forge-*.jar; do
+    [[ -f "$jar" ]] || continue
+    name="${jar##*/}"
+    case "$name" in
+      *installer*.jar | *sources*.jar) continue ;;
+    esac
+    jars+=("$name")
+  done
+  ((${#jars[@]})) || return 0
+  if ((${#jars[@]} == 1)); then
+    printf '%s\n' "${jars[0]}"
+    return 0
+  fi
+  printf '%s\n' "${jars[@]}" | LC_ALL=C sort -V | tail -n1
 }
 
 install_forge() {
@@ -1110,7 +1526,7 @@ install_forge() {
 
   sha1=""
   if sha1=$(http_get "${installer_url}.sha1" 2>/dev/null); then
-    sha1=$(awk '{print $1; exit}' <<<"$sha1")
+    read -r sha1 _ <<<"$sha1" || sha1=""
     verify_checksum sha1 "$sha1" "$installer"
   else
     warn_msg forge_checksum_missing
@@ -1122,7 +1538,12 @@ install_forge() {
   fi
 
   info_msg forge_installing
-  if ! (cd -- "$SERVER_DIR" && "$JAVA_COMMAND" -jar "$installer" --installServer); then
+  # The installer JVM lives for seconds; serial GC, capped tiered
+  # compilation and class-data sharing trim its startup time and peak
+  # memory, which matters on small hosts.
+  if ! (cd -- "$SERVER_DIR" && "$JAVA_COMMAND" \
+    -XX:+UseSerialGC -XX:TieredStopAtLevel=1 -Xshare:auto \
+    -jar "$installer" --installServer); then
     die_msg forge_install_failed
   fi
 
@@ -1213,34 +1634,34 @@ write_info_file() {
     printf 'MCSMaker: %s\n' "$SCRIPT_VERSION"
     printf 'Server: %s\n' "$INSTALL_DETAIL"
     printf 'Minecraft: %s\n' "$MC_VERSION"
+    timestamp_now
     if [[ "$LANGUAGE" == "de" ]]; then
       printf 'RAM: %s bis %s\n' "$MIN_RAM" "$MAX_RAM"
-      printf 'Erstellt: %s\n' "$(date --iso-8601=seconds 2>/dev/null || date)"
+      printf 'Erstellt: %s\n' "$TIMESTAMP_NOW"
     else
       printf 'RAM: %s to %s\n' "$MIN_RAM" "$MAX_RAM"
-      printf 'Created: %s\n' "$(date --iso-8601=seconds 2>/dev/null || date)"
+      printf 'Created: %s\n' "$TIMESTAMP_NOW"
     fi
   } >"$target"
 }
 
 write_machine_metadata() {
   local target="$SERVER_DIR/.mcsmaker.json" temporary="$TMP_DIR/mcsmaker.json"
-  jq -n \
-    --arg platform "$PLATFORM" \
-    --arg minecraft_version "$MC_VERSION" \
-    --arg min_ram "$MIN_RAM" \
-    --arg max_ram "$MAX_RAM" \
-    --arg mcsmaker_version "$SCRIPT_VERSION" \
-    --arg created_at "$(date --iso-8601=seconds 2>/dev/null || date)" \
-    '{
-      schema: 1,
-      platform: $platform,
-      minecraft_version: $minecraft_version,
-      min_ram: $min_ram,
-      max_ram: $max_ram,
-      mcsmaker_version: $mcsmaker_version,
-      created_at: $created_at
-    }' >"$temporary"
+  timestamp_now
+  # Every value here is already shape-validated (platform enum, version
+  # and RAM regexes, printf-built timestamp), so nothing needs JSON
+  # escaping and one printf replaces the jq fork.
+  printf '{
+  "schema": 1,
+  "platform": "%s",
+  "minecraft_version": "%s",
+  "min_ram": "%s",
+  "max_ram": "%s",
+  "mcsmaker_version": "%s",
+  "created_at": "%s"
+}\n' \
+    "$PLATFORM" "$MC_VERSION" "$MIN_RAM" "$MAX_RAM" \
+    "$SCRIPT_VERSION" "$TIMESTAMP_NOW" >"$temporary"
   backup_file "$target"
   mv -- "$temporary" "$target"
 }
@@ -1269,17 +1690,30 @@ pause_menu() {
   read -r _
 }
 
+# Sets EXPANDED_PATH instead of printing so callers do not need a
+# command-substitution subshell for a pure string transformation.
 expand_user_path() {
   case "$1" in
-    "~") printf '%s\n' "$HOME" ;;
-    "~/"*) printf '%s/%s\n' "$HOME" "${1:2}" ;;
-    *) printf '%s\n' "$1" ;;
+    "~") EXPANDED_PATH="$HOME" ;;
+    "~/"*) EXPANDED_PATH="$HOME/${1:2}" ;;
+    *) EXPANDED_PATH="$1" ;;
   esac
 }
 
+# The discovery scan walks up to four directory levels with find; the
+# result only changes when a server is created or the working directory
+# does, so it is memoized per directory for the session.
+DISCOVERED_SERVERS_PWD=""
+
+invalidate_discovered_servers() {
+  DISCOVERED_SERVERS_PWD=""
+}
+
 discover_servers() {
   local file directory
-  local -A seen=()
+  local -A seen=() seen_raw=()
+
+  [[ "$DISCOVERED_SERVERS_PWD" != "$PWD" ]] || return 0
   DISCOVERED_SERVERS=()
 
   if [[ -f "$PWD/start.sh" ]]; then
@@ -1288,9 +1722,14 @@ discover_servers() {
   fi
 
   while IFS= read -r -d '' file; do
-    directory=$(dirname -- "$file")
+    # Marker files for one server may appear twice; dedupe on the raw
+    # directory first so each candidate is canonicalized at most once.
+    directory="${file%/*}"
+    [[ -z "${seen_raw[$directory]:-}" ]] || continue
+    seen_raw["$directory"]=1
+    [[ -f "$directory/start.sh" ]] || continue
     directory=$(cd -- "$directory" && pwd -P)
-    if [[ -f "$directory/start.sh" && -z "${seen[$directory]:-}" ]]; then
+    if [[ -z "${seen[$directory]:-}" ]]; then
       DISCOVERED_SERVERS+=("$directory")
       seen["$directory"]=1
     fi
@@ -1298,24 +1737,46 @@ discover_servers() {
     find "$PWD" -mindepth 1 -maxdepth 4 -type f \
       \( -name '.mcsmaker.json' -o -name 'mcsmaker-info.txt' \) -print0 2>/dev/null
   )
+  DISCOVERED_SERVERS_PWD="$PWD"
 }
 
 choose_server_directory() {
   local choice manual index=1
   discover_servers
 
-  printf '\n%s\n' "$(msg found_servers)"
+  # Annotate the picker with platform/version from one jq pass over all
+  # metadata files instead of a fork per server; servers without (or
+  # with broken) metadata simply get no annotation.
+  local -A server_labels=()
+  local metadata_files=() directory file platform version
+  for directory in "${DISCOVERED_SERVERS[@]}"; do
+    [[ -f "$directory/.mcsmaker.json" ]] && metadata_files+=("$directory/.mcsmaker.json")
+  done
+  if ((${#metadata_files[@]})); then
+    while IFS=$'\t' read -r file platform version; do
+      [[ -n "$file" ]] || continue
+      server_labels["${file%/.mcsmaker.json}"]="${platform}, ${version}"
+    done < <(jq -r '[input_filename, (.platform // "?"), (.minecraft_version // "?")] | @tsv' \
+      "${metadata_files[@]}" 2>/dev/null || true)
+  fi
+
+  local listing="" line label
   if ((${#DISCOVERED_SERVERS[@]})); then
     for manual in "${DISCOVERED_SERVERS[@]}"; do
-      printf '  %d) %s\n' "$index" "$manual"
+      label="${server_labels[$manual]:-}"
+      if [[ -n "$label" ]]; then
+        printf -v line '  %d) %s (%s)\n' "$index" "$manual" "$label"
+      else
+        printf -v line '  %d) %s\n' "$index" "$manual"
+      fi
+      listing+="$line"
       ((index += 1))
     done
   else
-    printf '  %s\n' "$(msg none_found_here)"
+    printf -v listing '  %s\n' "$(msg none_found_here)"
   fi
-  printf '  m) %s\n' "$(msg manual_path)"
-  msg choice
-  read -r choice
+  printf '\n%s\n%s  m) %s\n' "$(msg found_servers)" "$listing" "$(msg manual_path)"
+  prompt_read choice choice
 
   if [[ "$choice" =~ ^[0-9]+$ ]] && ((choice >= 1 && choice <= ${#DISCOVERED_SERVERS[@]})); then
     SELECTED_SERVER_DIR="${DISCOVERED_SERVERS[choice - 1]}"
@@ -1323,8 +1784,7 @@ choose_server_directory() {
   fi
 
   if [[ "$choice" == "m" || "$choice" == "M" || ${#DISCOVERED_SERVERS[@]} -eq 0 ]]; then
-    msg server_path_prompt
-    read -r manual
+    prompt_read manual server_path_prompt
     SELECTED_SERVER_DIR="$manual"
     return
   fi
@@ -1337,12 +1797,31 @@ load_managed_metadata() {
   MANAGED_PLATFORM=""
   MANAGED_VERSION=""
 
-  if [[ -f "$metadata" ]] && jq -e . "$metadata" >/dev/null 2>&1; then
-    MANAGED_PLATFORM=$(jq -r '.platform // empty' "$metadata")
-    MANAGED_VERSION=$(jq -r '.minecraft_version // empty' "$metadata")
+  # jq exits non-zero on malformed JSON, so one invocation both
+  # validates and extracts; a broken file falls through to the info-file
+  # and heuristic fallbacks exactly as before.
+  if [[ -f "$metadata" ]] && IFS=$'\t' read -r MANAGED_PLATFORM MANAGED_VERSION < <(
+    jq -r '[.platform // "", .minecraft_version // ""] | @tsv' "$metadata" 2>/dev/null); then
+    :
   elif [[ -f "$info_file" ]]; then
-    MANAGED_PLATFORM=$(awk -F': ' '/^Server:/ {print tolower($2); exit}' "$info_file" | awk '{print $1}')
-    MANAGED_VERSION=$(awk -F': ' '/^Minecraft:/ {print $2; exit}' "$info_file")
+    # The info file is a handful of "Key: value" lines; one bash pass
+    # replaces the three awk forks the old extraction needed.
+    local line value
+    while IFS= read -r line; do
+      case "$line" in
+        Server:\ *)
+          value="${line#Server: }"
+          value="${value%% *}"
+          MANAGED_PLATFORM="${value,,}"
+          ;;
+        Minecraft:\ *)
+          MANAGED_VERSION="${line#Minecraft: }"
+          ;;
+      esac
+      if [[ -n "$MANAGED_PLATFORM" && -n "$MANAGED_VERSION" ]]; then
+        break
+      fi
+    done <"$info_file"
   fi
 
   if [[ -z "$MANAGED_PLATFORM" ]]; then
@@ -1375,7 +1854,8 @@ set_managed_server() {
     fi
   fi
 
-  requested=$(expand_user_path "$requested")
+  expand_user_path "$requested"
+  requested="$EXPANDED_PATH"
   [[ -d "$requested" ]] || die_msg server_dir_not_exist "$requested"
   MANAGED_SERVER_DIR=$(cd -- "$requested" && pwd -P)
   [[ -f "$MANAGED_SERVER_DIR/start.sh" ]] || die_msg start_missing "$MANAGED_SERVER_DIR"
@@ -1384,6 +1864,8 @@ set_managed_server() {
   fi
 
   load_managed_metadata
+  MANAGED_CACHED_PID=""
+  EXTERNAL_SERVER_PID=""
   MANAGED_STATE_DIR="$MANAGED_SERVER_DIR/.mcsmaker"
   MANAGED_PID_FILE="$MANAGED_STATE_DIR/server.pid"
   MANAGED_INPUT_FIFO="$MANAGED_STATE_DIR/console.in"
@@ -1410,55 +1892,104 @@ server_pid() {
 }
 
 server_running() {
-  local pid process_directory=""
-  pid=$(server_pid) || return 1
-  kill -0 "$pid" 2>/dev/null || return 1
+  local pid
+  # The live console polls this several times per second; keep the pid
+  # cached in the parent shell so the pid file is read once per start.
+  if [[ -n "$MANAGED_CACHED_PID" ]]; then
+    pid="$MANAGED_CACHED_PID"
+  else
+    pid=$(server_pid) || return 1
+    MANAGED_CACHED_PID="$pid"
+  fi
+  if ! kill -0 "$pid" 2>/dev/null; then
+    MANAGED_CACHED_PID=""
+    return 1
+  fi
 
   if [[ -L "/proc/$pid/cwd" ]]; then
-    process_directory=$(readlink -f "/proc/$pid/cwd" 2>/dev/null || true)
-    [[ -z "$process_directory" || "$process_directory" == "$MANAGED_SERVER_DIR" ]] || return 1
+    [[ "/proc/$pid/cwd" -ef "$MANAGED_SERVER_DIR" ]] || return 1
   fi
   return 0
 }
 
-external_server_pid() {
-  local cwd_link pid process_directory command_line managed_pid=""
+external_pid_matches() {
+  local pid="$1" command_line
+  local -a command_words
+  # -ef dereferences the cwd symlink and compares device/inode without
+  # forking readlink for every process on the system.
+  [[ "/proc/$pid/cwd" -ef "$MANAGED_SERVER_DIR" ]] || return 1
+  [[ -r "/proc/$pid/cmdline" ]] || return 1
+  command_words=()
+  mapfile -d '' -t command_words <"/proc/$pid/cmdline" 2>/dev/null || true
+  command_line="${command_words[*]}"
+  case "$command_line" in
+    *java*|*server.jar*|*start.sh*|*run.sh*) return 0 ;;
+  esac
+  return 1
+}
+
+# Sets EXTERNAL_SERVER_PID on success. Must run in the parent shell so
+# the last hit can be revalidated with one inode comparison instead of
+# rescanning all of /proc on every status/start/stop check.
+find_external_server_pid() {
+  local cwd_link pid managed_pid=""
+
+  # Revalidate the cached hit before anything else; the happy path then
+  # costs one inode comparison and no subshell.
+  if [[ -n "$EXTERNAL_SERVER_PID" ]] && external_pid_matches "$EXTERNAL_SERVER_PID"; then
+    return 0
+  fi
+  EXTERNAL_SERVER_PID=""
   managed_pid=$(server_pid || true)
 
   for cwd_link in /proc/[1-9][0-9]*/cwd; do
+    # With no matching /proc entries the glob stays unexpanded; skip the
+    # literal pattern (and processes that vanished mid-scan).
+    [[ -e "$cwd_link" ]] || continue
     pid="${cwd_link#/proc/}"
     pid="${pid%/cwd}"
     [[ "$pid" != "$$" && "$pid" != "$managed_pid" ]] || continue
-    process_directory=$(readlink -f "$cwd_link" 2>/dev/null || true)
-    [[ "$process_directory" == "$MANAGED_SERVER_DIR" ]] || continue
-    [[ -r "/proc/$pid/cmdline" ]] || continue
-    command_line=$(tr '\0' ' ' <"/proc/$pid/cmdline" 2>/dev/null || true)
-    case "$command_line" in
-      *java*|*server.jar*|*start.sh*|*run.sh*)
-        printf '%s\n' "$pid"
-        return 0
-        ;;
-    esac
+    external_pid_matches "$pid" || continue
+    EXTERNAL_SERVER_PID="$pid"
+    return 0
   done
   return 1
 }
 
 clear_runtime_state() {
+  MANAGED_CACHED_PID=""
   [[ -f "$MANAGED_PID_FILE" ]] && rm -f -- "$MANAGED_PID_FILE"
   [[ -p "$MANAGED_INPUT_FIFO" ]] && rm -f -- "$MANAGED_INPUT_FIFO"
   return 0
 }
 
+# Poll until the managed server process has exited, backing off from
+# fast sub-second checks to one-second intervals. Returns 1 on timeout.
+wait_for_server_exit() {
+  local timeout="${1:-30}" interval="0.1" started="$SECONDS"
+  while ((SECONDS - started < timeout)); do
+    server_running || return 0
+    sleep "$interval"
+    case "$interval" in
+      0.1) interval="0.2" ;;
+      0.2) interval="0.4" ;;
+      0.4) interval="0.8" ;;
+      *) interval="1" ;;
+    esac
+  done
+  server_running || return 0
+  return 1
+}
+
 server_start() {
-  local pid temporary_pid external_pid=""
+  local pid temporary_pid grace
   require_management_tools || return 1
   if server_running; then
     warn_msg server_already_running
     return 0
   fi
-  external_pid=$(external_server_pid || true)
-  if [[ -n "$external_pid" ]]; then
-    warn_msg external_server_running "$external_pid"
+  if find_external_server_pid; then
+    warn_msg external_server_running "$EXTERNAL_SERVER_PID"
     return 1
   fi
 
@@ -1484,7 +2015,8 @@ server_start() {
   fi
   touch "$MANAGED_CONSOLE_LOG"
   chmod 0600 "$MANAGED_CONSOLE_LOG"
-  printf '\n--- MCSMaker %s | %s ---\n' "$SCRIPT_VERSION" "$(date --iso-8601=seconds 2>/dev/null || date)" \
+  timestamp_now
+  printf '\n--- MCSMaker %s | %s ---\n' "$SCRIPT_VERSION" "$TIMESTAMP_NOW" \
     >>"$MANAGED_CONSOLE_LOG"
 
   info_msg server_starting
@@ -1499,7 +2031,13 @@ server_start() {
   printf '%s\n' "$pid" >"$temporary_pid"
   chmod 0600 "$temporary_pid"
   mv -- "$temporary_pid" "$MANAGED_PID_FILE"
-  sleep 1
+  MANAGED_CACHED_PID="$pid"
+  # Same one-second grace period as before, but polled in small steps so
+  # an immediate crash is reported as soon as it happens.
+  for grace in 0.1 0.1 0.2 0.2 0.4; do
+    server_running || break
+    sleep "$grace"
+  done
 
   if server_running; then
     success_msg server_started
@@ -1527,8 +2065,7 @@ server_send_command() {
   server_running || { warn_msg server_not_running; return 1; }
 
   if [[ -z "$command" ]]; then
-    msg command_prompt
-    read -r command
+    prompt_read command command_prompt
   fi
   [[ -n "$command" ]] || { warn_msg empty_command; return 1; }
   [[ "$command" != *$'\n'* && "$command" != *$'\r'* ]] || { warn_msg multiline_command; return 1; }
@@ -1539,12 +2076,11 @@ server_send_command() {
 }
 
 server_stop() {
-  local answer second pid="" external_pid=""
+  local answer pid=""
   if ! server_running; then
     clear_runtime_state
-    external_pid=$(external_server_pid || true)
-    if [[ -n "$external_pid" ]]; then
-      warn_msg external_server_running "$external_pid"
+    if find_external_server_pid; then
+      warn_msg external_server_running "$EXTERNAL_SERVER_PID"
       return 1
     fi
     warn_msg server_not_running
@@ -1553,28 +2089,21 @@ server_stop() {
 
   info_msg server_stopping
   send_command_raw "stop" || return 1
-  for ((second = 0; second < 30; second++)); do
-    if ! server_running; then
-      clear_runtime_state
-      success_msg server_stopped
-      return 0
-    fi
-    sleep 1
-  done
+  if wait_for_server_exit 30; then
+    clear_runtime_state
+    success_msg server_stopped
+    return 0
+  fi
 
   warn_msg server_unresponsive
   if [[ -t 0 ]]; then
-    msg hard_kill_prompt
-    read -r answer
+    prompt_read answer hard_kill_prompt
     case "$answer" in
       j|J|ja|JA|Ja|y|Y|yes|YES|Yes)
         pid=$(server_pid || true)
         if [[ -n "$pid" ]] && server_running; then
           kill "$pid" 2>/dev/null || true
-          for ((second = 0; second < 5; second++)); do
-            server_running || break
-            sleep 1
-          done
+          wait_for_server_exit 5 || true
           server_running && kill -KILL "$pid" 2>/dev/null || true
         fi
         clear_runtime_state
@@ -1608,10 +2137,25 @@ server_recent_console() {
   fi
 }
 
+# Terminal size for the live console, probed once per session and after
+# SIGWINCH instead of forking tput twice for every redraw.
+LIVE_CONSOLE_COLUMNS=80
+LIVE_CONSOLE_ROWS=24
+LIVE_CONSOLE_SIZE_STALE=1
+LIVE_CONSOLE_BORDER=""
+LIVE_CONSOLE_BORDER_COLUMNS=0
+
+refresh_live_console_size() {
+  LIVE_CONSOLE_COLUMNS=$(tput cols 2>/dev/null || printf '80')
+  LIVE_CONSOLE_ROWS=$(tput lines 2>/dev/null || printf '24')
+  LIVE_CONSOLE_SIZE_STALE=0
+}
+
 draw_live_console() {
   local input="$1" notice="$2" columns rows log_lines border output
-  columns=$(tput cols 2>/dev/null || printf '80')
-  rows=$(tput lines 2>/dev/null || printf '24')
+  ((LIVE_CONSOLE_SIZE_STALE)) && refresh_live_console_size
+  columns=$LIVE_CONSOLE_COLUMNS
+  rows=$LIVE_CONSOLE_ROWS
   [[ "$columns" =~ ^[0-9]+$ ]] || columns=80
   [[ "$rows" =~ ^[0-9]+$ ]] || rows=24
   ((columns < 50)) && columns=50
@@ -1619,8 +2163,14 @@ draw_live_console() {
   log_lines=$((rows - 10))
   ((log_lines < 5)) && log_lines=5
   ((log_lines > 200)) && log_lines=200
-  printf -v border '%*s' "$columns" ''
-  border=${border// /-}
+  # The dash border only changes with the terminal width; rebuild it on
+  # resize instead of expanding the substitution on every redraw.
+  if ((columns != LIVE_CONSOLE_BORDER_COLUMNS)); then
+    printf -v LIVE_CONSOLE_BORDER '%*s' "$columns" ''
+    LIVE_CONSOLE_BORDER=${LIVE_CONSOLE_BORDER// /-}
+    LIVE_CONSOLE_BORDER_COLUMNS=$columns
+  fi
+  border=$LIVE_CONSOLE_BORDER
   if [[ -f "$MANAGED_CONSOLE_LOG" ]]; then
     output=$(tail -n "$log_lines" "$MANAGED_CONSOLE_LOG" 2>/dev/null || true)
   elif [[ -f "$MANAGED_SERVER_DIR/logs/latest.log" ]]; then
@@ -1629,19 +2179,19 @@ draw_live_console() {
     output=""
   fi
 
-  printf '\033[2J\033[H'
-  printf '%s%s%s  |  %s\n' "$C_BLUE" "$(msg console_title)" "$C_RESET" "$MANAGED_SERVER_DIR"
-  printf '%s\n' "$border"
-  if [[ -n "$output" ]]; then
-    printf '%s\n' "$output" | tail -n "$log_lines"
-  else
-    printf '%s\n' "$(msg no_console_log)"
-  fi
-  printf '%s\n' "$border"
-  printf '%s\n' "$(msg console_help)"
-  printf '%s%s%s\n' "$C_DIM" "$(msg console_back_hint)" "$C_RESET"
-  [[ -n "$notice" ]] && printf '%s%s%s\n' "$C_GREEN" "$notice" "$C_RESET"
-  printf '> %s' "$input"
+  # Assemble the whole frame and write it with one printf: a redraw is
+  # a single terminal write instead of ~10, which avoids visible tearing
+  # and per-write flushes on slow TTYs.
+  local frame
+  printf -v frame '\033[2J\033[H%s%s%s  |  %s\n%s\n%s\n%s\n%s\n%s%s%s\n' \
+    "$C_BLUE" "$LIVE_CONSOLE_TITLE" "$C_RESET" "$MANAGED_SERVER_DIR" \
+    "$border" \
+    "${output:-$LIVE_CONSOLE_NO_LOG}" \
+    "$border" \
+    "$LIVE_CONSOLE_HELP" \
+    "$C_DIM" "$LIVE_CONSOLE_HINT" "$C_RESET"
+  [[ -n "$notice" ]] && printf -v frame '%s%s%s%s\n' "$frame" "$C_GREEN" "$notice" "$C_RESET"
+  printf '%s> %s' "$frame" "$input"
 }
 
 console_log_signature() {
@@ -1657,52 +2207,74 @@ console_log_signature() {
 
 server_live_console() {
   local input="" key="" notice="" last_log_signature="" current_log_signature normalized
+  local poll_tick=0
   server_running || { warn_msg server_not_running; return 1; }
   [[ -t 0 && -t 1 ]] || { warn_msg console_tty_required; return 1; }
 
+  # Resolve the static console labels once; the redraw path runs several
+  # times per second and should not fork msg subshells for fixed text.
+  LIVE_CONSOLE_TITLE=$(msg console_title)
+  LIVE_CONSOLE_NO_LOG=$(msg no_console_log)
+  LIVE_CONSOLE_HELP=$(msg console_help)
+  LIVE_CONSOLE_HINT=$(msg console_back_hint)
+
+  LIVE_CONSOLE_SIZE_STALE=1
+  trap 'LIVE_CONSOLE_SIZE_STALE=1' WINCH
+
   draw_live_console "$input" "$notice"
   last_log_signature=$(console_log_signature)
   while server_running; do
-    current_log_signature=$(console_log_signature)
-    if [[ "$current_log_signature" != "$last_log_signature" ]]; then
-      draw_live_console "$input" "$notice"
-      last_log_signature="$current_log_signature"
+    # Probing the log costs a stat fork; every 4th idle tick (~0.6 s) is
+    # plenty for a human-readable console and quarters the fork rate.
+    if ((poll_tick++ % 4 == 0)); then
+      current_log_signature=$(console_log_signature)
+      if [[ "$current_log_signature" != "$last_log_signature" ]]; then
+        draw_live_console "$input" "$notice"
+        last_log_signature="$current_log_signature"
+      fi
     fi
 
     if IFS= read -rsn1 -t 0.15 key; then
-      if [[ -z "$key" ]]; then
-        normalized="${input,,}"
-        case "$normalized" in
-          /back|/exit|/quit)
-            printf '\033[2J\033[H'
-            success_msg console_returned
-            return 0
-            ;;
-          /refresh|"")
-            notice=""
-            ;;
-          /help)
-            notice=$(msg console_help_notice)
-            ;;
-          *)
-            if send_command_raw "${input#/}"; then
-              notice=$(msg command_sent "${input#/}")
-            else
-              notice=$(msg console_send_failed)
-            fi
-            ;;
-        esac
-        input=""
-      elif [[ "$key" == $'\177' || "$key" == $'\b' ]]; then
-        input="${input%?}"
-      elif [[ "$key" == [[:print:]] ]] && ((${#input} < 500)); then
-        input+="$key"
-      fi
+      # Consume every key already buffered (e.g. pasted text) before
+      # redrawing, so a paste costs one redraw instead of one per char.
+      while true; do
+        if [[ -z "$key" ]]; then
+          normalized="${input,,}"
+          case "$normalized" in
+            /back|/exit|/quit)
+              trap - WINCH
+              printf '\033[2J\033[H'
+              success_msg console_returned
+              return 0
+              ;;
+            /refresh|"")
+              notice=""
+              ;;
+            /help)
+              notice=$(msg console_help_notice)
+              ;;
+            *)
+              if send_command_raw "${input#/}"; then
+                notice=$(msg command_sent "${input#/}")
+              else
+                notice=$(msg console_send_failed)
+              fi
+              ;;
+          esac
+          input=""
+        elif [[ "$key" == $'\177' || "$key" == $'\b' ]]; then
+          input="${input%?}"
+        elif [[ "$key" == [[:print:]] ]] && ((${#input} < 500)); then
+          input+="$key"
+        fi
+        IFS= read -rsn1 -t 0.01 key || break
+      done
       draw_live_console "$input" "$notice"
       last_log_signature=$(console_log_signature)
     fi
   done
 
+  trap - WINCH
   printf '\033[2J\033[H'
   clear_runtime_state
   warn_msg console_server_ended
@@ -1710,7 +2282,7 @@ server_live_console() {
 }
 
 server_status() {
-  local state pid="" elapsed="" disk addon_count=0 display_version external_pid=""
+  local state pid="" elapsed="" disk addon_count=0 display_version
   local addon_directories=()
   state=$(msg status_stopped)
   disk=$(msg unknown)
@@ -1720,24 +2292,28 @@ server_status() {
     state=$(msg status_running)
     pid=$(server_pid || true)
     if [[ -n "$pid" ]] && command -v ps >/dev/null 2>&1; then
-      elapsed=$(ps -o etime= -p "$pid" 2>/dev/null | xargs || true)
+      read -r elapsed < <(ps -o etime= -p "$pid" 2>/dev/null) || elapsed=""
     fi
   else
-    external_pid=$(external_server_pid || true)
-    if [[ -n "$external_pid" ]]; then
+    if find_external_server_pid; then
       state=$(msg status_external)
-      pid="$external_pid"
+      pid="$EXTERNAL_SERVER_PID"
       if command -v ps >/dev/null 2>&1; then
-        elapsed=$(ps -o etime= -p "$pid" 2>/dev/null | xargs || true)
+        read -r elapsed < <(ps -o etime= -p "$pid" 2>/dev/null) || elapsed=""
       fi
     fi
   fi
-  command -v du >/dev/null 2>&1 && disk=$(du -sh "$MANAGED_SERVER_DIR" 2>/dev/null | awk '{print $1}')
+  if command -v du >/dev/null 2>&1; then
+    read -r disk _ < <(du -sh "$MANAGED_SERVER_DIR" 2>/dev/null) || disk=$(msg unknown)
+  fi
   [[ -d "$MANAGED_SERVER_DIR/mods" ]] && addon_directories+=("$MANAGED_SERVER_DIR/mods")
   [[ -d "$MANAGED_SERVER_DIR/plugins" ]] && addon_directories+=("$MANAGED_SERVER_DIR/plugins")
-  if ((${#addon_directories[@]})); then
-    addon_count=$(find "${addon_directories[@]}" -maxdepth 1 -type f -name '*.jar' -print 2>/dev/null | wc -l | tr -d ' ')
-  fi
+  local addon_directory addon_file
+  for addon_directory in "${addon_directories[@]}"; do
+    for addon_file in "$addon_directory"/*.jar; do
+      [[ -f "$addon_file" ]] && ((addon_count += 1))
+    done
+  done
 
   printf '\n%s\n' "$(msg status_title)"
   printf '  %-11s %s\n' 'Status:' "$state"
@@ -1756,7 +2332,8 @@ server_backup() {
   command -v tar >/dev/null 2>&1 || { warn_msg tar_missing; return 1; }
 
   backup_dir="$MANAGED_SERVER_DIR/backups"
-  timestamp=$(date +%Y%m%d-%H%M%S)
+  timestamp_compact
+  timestamp="$TIMESTAMP_COMPACT"
   archive="$backup_dir/server-backup-${timestamp}.tar.gz"
   mkdir -p -- "$backup_dir"
 
@@ -1776,9 +2353,14 @@ server_backup() {
   fi
 
   info_msg backup_creating
+  # World region files and jars are already deflate-compressed, so the
+  # default gzip level mostly burns CPU; level 1 is close in size and
+  # several times faster on typical server directories.
   if ! tar --exclude='./backups' --exclude='./logs' --exclude='./cache' \
+    --exclude='./crash-reports' --exclude='./.mcsmaker-tmp.*' \
+    --exclude='session.lock' --exclude='*.part[0-9]' \
     --exclude='./.mcsmaker/console.in' --exclude='./.mcsmaker/server.pid' \
-    -C "$MANAGED_SERVER_DIR" -czf "$archive" .; then
+    -C "$MANAGED_SERVER_DIR" -cf - . | gzip -1 >"$archive"; then
     result=1
   fi
 
@@ -1795,6 +2377,11 @@ server_backup() {
 }
 
 configure_addon_type() {
+  # The facet tables depend only on platform and version; skip the jq
+  # fork when they are already built for the currently managed server.
+  local cache_key="${MANAGED_PLATFORM}|${MANAGED_VERSION}|${MANAGED_SERVER_DIR}"
+  [[ "$ADDON_CONFIG_CACHE_KEY" != "$cache_key" ]] || return 0
+
   case "$MANAGED_PLATFORM" in
     paper)
       ADDON_KIND="plugin"
@@ -1838,11 +2425,15 @@ configure_addon_type() {
       return 1
       ;;
   esac
+  ADDON_CONFIG_CACHE_KEY="$cache_key"
 }
 
 ensure_temp_directory() {
   if [[ -z "$TMP_DIR" || ! -d "$TMP_DIR" ]]; then
-    TMP_DIR=$(mktemp -d "${TMPDIR:-/tmp}/mcsmaker.XXXXXXXX")
+    # Same-filesystem staging as in prepare_server_directory: addon jars
+    # then move into place with a rename instead of a copy.
+    TMP_DIR=$(mktemp -d "$MANAGED_SERVER_DIR/.mcsmaker-tmp.XXXXXXXX" 2>/dev/null) || \
+      TMP_DIR=$(mktemp -d "${TMPDIR:-/tmp}/mcsmaker.XXXXXXXX")
   fi
 }
 
@@ -1856,8 +2447,7 @@ addon_search_install() {
   [[ "$MANAGED_VERSION" != "unknown" ]] || { warn_msg mc_version_unknown; return 1; }
 
   if [[ -z "$query" ]]; then
-    msg addon_search_prompt "$(msg "${ADDON_KIND}_label")"
-    read -r query
+    prompt_read query addon_search_prompt "$(msg "${ADDON_KIND}_label")"
   fi
   [[ -n "$query" ]] || { warn_msg addon_query_empty; return 1; }
 
@@ -1870,10 +2460,14 @@ addon_search_install() {
     return 1
   fi
 
+  # The label is loop-invariant; resolve it once instead of forking a
+  # msg subshell for every result row.
+  local downloads_label
+  downloads_label=$(msg downloads_label)
   printf '\n%s\n' "$(msg modrinth_results)"
   while IFS=$'\t' read -r selection title download_url raw_filename; do
     printf '  %s) %s  [%s %s]\n     %s\n' \
-      "$selection" "$title" "$download_url" "$(msg downloads_label)" "$raw_filename"
+      "$selection" "$title" "$download_url" "$downloads_label" "$raw_filename"
   done < <(
     jq -r '.hits | to_entries[] | [
       (.key + 1),
@@ -1883,8 +2477,7 @@ addon_search_install() {
     ] | @tsv' <<<"$response"
   )
   printf '  0) %s\n' "$(msg cancel)"
-  msg choice
-  read -r selection
+  prompt_read selection choice
   [[ "$selection" =~ ^[0-9]+$ ]] || { warn_msg invalid_choice; return 1; }
   ((selection == 0)) && return 0
   ((selection >= 1 && selection <= count)) || { warn_msg invalid_choice; return 1; }
@@ -1908,6 +2501,13 @@ addon_search_install() {
   sha512=$(jq -r '.hashes.sha512 // empty' <<<"$file")
   [[ "$filename" == *.jar ]] || { warn_msg download_not_jar; return 1; }
 
+  # Re-installing the same release is common from the menu; when the jar
+  # already in place matches the published hash there is nothing to fetch.
+  if checksum_matches sha512 "$sha512" "$ADDON_TARGET_DIR/$filename"; then
+    success_msg addon_up_to_date "$title" "$version_number" "$filename"
+    return 0
+  fi
+
   ensure_temp_directory
   downloaded="$TMP_DIR/$filename"
   download_file "$download_url" "$downloaded" "$MODRINTH_USER_AGENT"
@@ -1918,8 +2518,9 @@ addon_search_install() {
   backup_file "$ADDON_TARGET_DIR/$filename"
   mv -- "$downloaded" "$ADDON_TARGET_DIR/$filename"
   chmod 0644 "$ADDON_TARGET_DIR/$filename"
+  timestamp_now
   printf '%s\t%s\t%s\t%s\t%s\n' \
-    "$(date --iso-8601=seconds 2>/dev/null || date)" "$project_id" "$title" "$version_number" "$filename" \
+    "$TIMESTAMP_NOW" "$project_id" "$title" "$version_number" "$filename" \
     >>"$MANAGED_SERVER_DIR/.mcsmaker/addons.tsv"
 
   success_msg addon_installed "$title" "$version_number" "$filename"
@@ -1934,20 +2535,32 @@ addon_search_install() {
 }
 
 addon_files() {
-  configure_addon_type >/dev/null || return 1
+  # Callers run configure_addon_type before invoking this; relying on
+  # the already-set ADDON_TARGET_DIR avoids re-deriving it inside the
+  # process-substitution subshell every caller wraps around us.
+  local file
   [[ -d "$ADDON_TARGET_DIR" ]] || return 0
-  find "$ADDON_TARGET_DIR" -maxdepth 1 -type f -name '*.jar' -print0 2>/dev/null
+  for file in "$ADDON_TARGET_DIR"/*.jar; do
+    [[ -f "$file" ]] || continue
+    printf '%s\0' "$file"
+  done
 }
 
 addon_list() {
-  local file count=0
+  local file count=0 listing=""
   configure_addon_type || return 1
-  printf '\n%s\n' "$(msg installed_addons "$(msg "${ADDON_KIND}s_label")")"
+  # Accumulate the rows and emit them with one write; the parameter
+  # expansion also drops the basename fork per jar.
   while IFS= read -r -d '' file; do
     ((count += 1))
-    printf '  %d) %s\n' "$count" "$(basename -- "$file")"
+    printf -v listing '%s  %d) %s\n' "$listing" "$count" "${file##*/}"
   done < <(addon_files)
-  ((count > 0)) || printf '  %s\n' "$(msg none_found)"
+  printf '\n%s\n' "$(msg installed_addons "$(msg "${ADDON_KIND}s_label")")"
+  if ((count > 0)); then
+    printf '%s' "$listing"
+  else
+    printf '  %s\n' "$(msg none_found)"
+  fi
 }
 
 addon_disable() {
@@ -1956,13 +2569,12 @@ addon_disable() {
   while IFS= read -r -d '' file; do files+=("$file"); done < <(addon_files)
   ((${#files[@]})) || { warn_msg none_to_disable; return 0; }
 
-  printf '\n%s\n' "$(msg disable_addon)"
+  local listing=""
   for selection in "${!files[@]}"; do
-    printf '  %d) %s\n' "$((selection + 1))" "$(basename -- "${files[selection]}")"
+    printf -v listing '%s  %d) %s\n' "$listing" "$((selection + 1))" "${files[selection]##*/}"
   done
-  printf '  0) %s\n' "$(msg cancel)"
-  msg choice
-  read -r selection
+  printf '\n%s\n%s  0) %s\n' "$(msg disable_addon)" "$listing" "$(msg cancel)"
+  prompt_read selection choice
   [[ "$selection" =~ ^[0-9]+$ ]] || return 1
   ((selection == 0)) && return 0
   ((selection >= 1 && selection <= ${#files[@]})) || return 1
@@ -1984,18 +2596,17 @@ addon_enable() {
   configure_addon_type || return 1
   disabled_dir="$ADDON_TARGET_DIR/disabled"
   [[ -d "$disabled_dir" ]] || { warn_msg none_disabled; return 0; }
-  while IFS= read -r -d '' file; do files+=("$file"); done < <(
-    find "$disabled_dir" -maxdepth 1 -type f -name '*.jar' -print0 2>/dev/null
-  )
+  for file in "$disabled_dir"/*.jar; do
+    [[ -f "$file" ]] && files+=("$file")
+  done
   ((${#files[@]})) || { warn_msg none_disabled; return 0; }
 
-  printf '\n%s\n' "$(msg enable_addon)"
+  local listing=""
   for selection in "${!files[@]}"; do
-    printf '  %d) %s\n' "$((selection + 1))" "$(basename -- "${files[selection]}")"
+    printf -v listing '%s  %d) %s\n' "$listing" "$((selection + 1))" "${files[selection]##*/}"
   done
-  printf '  0) %s\n' "$(msg cancel)"
-  msg choice
-  read -r selection
+  printf '\n%s\n%s  0) %s\n' "$(msg enable_addon)" "$listing" "$(msg cancel)"
+  prompt_read selection choice
   [[ "$selection" =~ ^[0-9]+$ ]] || return 1
   ((selection == 0)) && return 0
   ((selection >= 1 && selection <= ${#files[@]})) || return 1
@@ -2012,16 +2623,18 @@ addon_enable() {
 }
 
 addon_menu() {
-  local choice
+  local choice menu_block
+
+  # The menu text is invariant while this menu runs; render it once
+  # instead of spawning a msg subshell per line on every iteration.
+  printf -v menu_block '\n%s (%s %s)\n  1) %s\n  2) %s\n  3) %s\n  4) %s\n  0) %s\n' \
+    "$(msg addon_manager)" "$MANAGED_PLATFORM" "$MANAGED_VERSION" \
+    "$(msg addon_search_install)" "$(msg addon_list)" \
+    "$(msg addon_disable)" "$(msg addon_enable)" "$(msg back)"
+
   while true; do
-    printf '\n%s (%s %s)\n' "$(msg addon_manager)" "$MANAGED_PLATFORM" "$MANAGED_VERSION"
-    printf '  1) %s\n' "$(msg addon_search_install)"
-    printf '  2) %s\n' "$(msg addon_list)"
-    printf '  3) %s\n' "$(msg addon_disable)"
-    printf '  4) %s\n' "$(msg addon_enable)"
-    printf '  0) %s\n' "$(msg back)"
-    msg choice
-    read -r choice
+    printf '%s' "$menu_block"
+    prompt_read choice choice
     case "$choice" in
       1) addon_search_install || true; pause_menu ;;
       2) addon_list || true; pause_menu ;;
@@ -2034,29 +2647,25 @@ addon_menu() {
 }
 
 manage_server_menu() {
-  local choice command
+  local choice command menu_block
   [[ -t 0 ]] || die_msg management_terminal_required
+
+  printf -v menu_block '\n%s\n  1) %s\n  2) %s\n  3) %s\n  4) %s\n  5) %s\n  6) %s\n  7) %s\n  8) %s\n  0) %s\n' \
+    "$(msg management_title)" \
+    "$(msg menu_start)" "$(msg menu_console)" "$(msg menu_recent)" \
+    "$(msg menu_command)" "$(msg menu_stop)" "$(msg menu_restart)" \
+    "$(msg menu_addons)" "$(msg menu_backup)" "$(msg back)"
+
   while true; do
     server_status
-    printf '\n%s\n' "$(msg management_title)"
-    printf '  1) %s\n' "$(msg menu_start)"
-    printf '  2) %s\n' "$(msg menu_console)"
-    printf '  3) %s\n' "$(msg menu_recent)"
-    printf '  4) %s\n' "$(msg menu_command)"
-    printf '  5) %s\n' "$(msg menu_stop)"
-    printf '  6) %s\n' "$(msg menu_restart)"
-    printf '  7) %s\n' "$(msg menu_addons)"
-    printf '  8) %s\n' "$(msg menu_backup)"
-    printf '  0) %s\n' "$(msg back)"
-    msg choice
-    read -r choice
+    printf '%s' "$menu_block"
+    prompt_read choice choice
     case "$choice" in
       1) server_start || true; pause_menu ;;
       2) server_live_console || true ;;
       3) server_recent_console 120 || true; pause_menu ;;
       4)
-        msg command_prompt
-        read -r command
+        prompt_read command command_prompt
         server_send_command "$command" || true
         pause_menu
         ;;
@@ -2125,6 +2734,7 @@ create_server_workflow() {
   print_result
   cleanup
   TMP_DIR=""
+  invalidate_discovered_servers
 }
 
 create_server_main() {
@@ -2165,18 +2775,20 @@ run_menu_action() {
 }
 
 main_menu() {
-  local choice
+  local choice menu_block="" menu_language=""
   [[ -t 0 ]] || die_msg main_terminal_required
 
   while true; do
     show_banner
-    msg_line main_question
-    printf '  1) %s\n' "$(msg main_create)"
-    printf '  2) %s\n' "$(msg main_manage)"
-    printf '  3) %s\n' "$(msg main_help)"
-    printf '  4) %s\n' "$(msg main_language)"
-    printf '  0) %s\n' "$(msg main_exit)"
-    printf '\n%s' "$(msg choice)"
+    # One cached block and a single printf per render instead of seven
+    # subshell+write pairs; rebuilt only after a language switch.
+    if [[ "$menu_language" != "$LANGUAGE" ]]; then
+      printf -v menu_block '%s\n  1) %s\n  2) %s\n  3) %s\n  4) %s\n  0) %s\n\n%s' \
+        "$(msg main_question)" "$(msg main_create)" "$(msg main_manage)" \
+        "$(msg main_help)" "$(msg main_language)" "$(msg main_exit)" "$(msg choice)"
+      menu_language="$LANGUAGE"
+    fi
+    printf '%s' "$menu_block"
     read -r choice
     case "$choice" in
       1) run_menu_action interactive_create_action; pause_menu ;;
@@ -2189,6 +2801,16 @@ main_menu() {
   done
 }
 
+# Shared front half of the simple one-directory subcommands: validate
+# arity, bind the server, run the handler.
+management_action() {
+  local handler="$1"
+  shift
+  (($# <= 1)) || die_msg subcommand_arg_error "$subcommand"
+  set_managed_server "${1:-}"
+  "$handler"
+}
+
 run_management_command() {
   local subcommand="$1" directory="" lines="100" command="" query=""
   shift
@@ -2199,18 +2821,12 @@ run_management_command() {
       set_managed_server "${1:-}"
       manage_server_menu
       ;;
-    start|stop|restart|status|console|backup)
-      (($# <= 1)) || die_msg subcommand_arg_error "$subcommand"
-      set_managed_server "${1:-}"
-      case "$subcommand" in
-        start) server_start ;;
-        stop) server_stop ;;
-        restart) server_restart ;;
-        status) server_status ;;
-        console) server_live_console ;;
-        backup) server_backup ;;
-      esac
-      ;;
+    start) management_action server_start "$@" ;;
+    stop) management_action server_stop "$@" ;;
+    restart) management_action server_restart "$@" ;;
+    status) management_action server_status "$@" ;;
+    console) management_action server_live_console "$@" ;;
+    backup) management_action server_backup "$@" ;;
     logs)
       if (($# > 0)) && [[ "$1" =~ ^[0-9]+$ ]] && [[ -f "$PWD/start.sh" ]]; then
         lines="$1"